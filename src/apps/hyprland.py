@@ -64,7 +64,8 @@ class HyprlandThemer:
         # Categorize files based on their content and role
         for config_file in found_configs:
             file_path = config_file["path"]
-            content = config_file.get("content", "")
+            # Unreadable files (content None) are classified by path only
+            content = config_file.get("content") or ""
             color_references = config_file.get("color_references", [])
             
             # Check if this file has color definitions
@@ -162,6 +163,11 @@ class HyprlandThemer:
                 with open(config_path, 'r') as f:
                     content = f.read()
             
+            # Never overwrite a file whose current content couldn't be read
+            if content is None:
+                logger.warning(f"Skipping {config_path} - could not read current content")
+                return False
+            
             # Check if this file actually has theme-related content
             if not self._file_has_theme_content(content):
                 logger.info(f"Skipping {config_path} - no theme content detected")
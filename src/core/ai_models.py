@@ -16,18 +16,32 @@ logger = logging.getLogger(__name__)
 class OllamaManager:
     """Manages Ollama model operations for local AI processing"""
     
+    # Seconds to reuse the last availability probe before running it again
+    AVAILABILITY_TTL = 30
+    
     def __init__(self):
         self.available_models = {}
         self.preloaded_models = set()
+        self._availability = None
+        self._availability_checked_at = 0.0
+        
+    def check_ollama_availability(self, refresh: bool = False) -> bool:
+        """Check if Ollama is installed and running (cached for a short TTL)"""
+        now = time.monotonic()
+        if (not refresh and self._availability is not None
+                and now - self._availability_checked_at < self.AVAILABILITY_TTL):
+            return self._availability
         
-    def check_ollama_availability(self) -> bool:
-        """Check if Ollama is installed and running"""
         try:
             result = subprocess.run(['ollama', 'list'], 
                                   capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
+            available = result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            available = False
+        
+        self._availability = available
+        self._availability_checked_at = now
+        return available
     
     def list_models(self) -> Dict[str, Dict]:
         """Get list of available Ollama models"""
@@ -107,39 +107,24 @@ class MaterialYouColorExtractor:
         """Advanced fallback color extraction using image analysis"""
         try:
             from PIL import Image, ImageFilter
-            import numpy as np
-            from sklearn.cluster import KMeans
-            
+
             with Image.open(wallpaper_path) as img:
                 img = img.convert('RGB')
-                
+
                 # Resize for processing
                 img = img.resize((300, 300))
-                
+
                 # Apply slight blur to smooth out noise
                 img = img.filter(ImageFilter.GaussianBlur(radius=1))
-                
-                # Convert to numpy array
-                img_array = np.array(img)
-                img_array = img_array.reshape((-1, 3))
-                
-                # Use K-means clustering to find dominant colors
+
+                # Quantize with Pillow's C octree, K-means only if unavailable
                 n_colors = 8
-                kmeans = KMeans(n_clusters=n_colors, random_state=42, n_init=10)
-                kmeans.fit(img_array)
-                
-                # Get the colors and their frequencies
-                colors = kmeans.cluster_centers_.astype(int)
-                labels = kmeans.labels_
-                label_counts = np.bincount(labels)
-                
-                # Sort by frequency
-                color_freq = list(zip(colors, label_counts))
-                color_freq.sort(key=lambda x: x[1], reverse=True)
-                
-                # Extract primary colors
-                dominant_colors = [self._rgb_to_hex(color[0]) for color in color_freq[:4]]
-                
+                try:
+                    dominant_colors = self._quantize_dominant_colors(img, n_colors)
+                except (AttributeError, ValueError) as e:
+                    logger.debug(f"Pillow quantize unavailable, using K-means: {e}")
+                    dominant_colors = self._kmeans_dominant_colors(img, n_colors)
+
                 # Generate Material You palette
                 return self._generate_material_palette(dominant_colors)
                 
@@ -149,7 +134,46 @@ class MaterialYouColorExtractor:
         except Exception as e:
             logger.error(f"Fallback extraction failed: {e}")
             return self._get_default_palette()
-    
+
+    def _quantize_dominant_colors(self, img, n_colors: int) -> List[str]:
+        """Find the most frequent colors using Pillow's fast octree quantizer"""
+        from PIL import Image
+        import numpy as np
+
+        quantized = img.quantize(colors=n_colors, method=Image.Quantize.FASTOCTREE,
+                                 dither=Image.Dither.NONE)
+        palette = quantized.getpalette()[:n_colors * 3]
+        counts = np.bincount(np.asarray(quantized).ravel(), minlength=n_colors)[:n_colors]
+
+        # Sort palette entries by pixel count, ignoring unused slots
+        order = [i for i in np.argsort(-counts) if counts[i] > 0 and i * 3 + 2 < len(palette)]
+        return [self._rgb_to_hex(tuple(palette[i * 3:i * 3 + 3])) for i in order[:4]]
+
+    def _kmeans_dominant_colors(self, img, n_colors: int) -> List[str]:
+        """Find the most frequent colors using K-means clustering"""
+        import numpy as np
+        from sklearn.cluster import KMeans
+
+        # Convert to numpy array
+        img_array = np.array(img)
+        img_array = img_array.reshape((-1, 3))
+
+        # Elkan skips most distance computations; one init is enough since
+        # colors are ranked by cluster size rather than inertia
+        kmeans = KMeans(n_clusters=n_colors, algorithm='elkan', n_init=1, random_state=42)
+        kmeans.fit(img_array)
+
+        # Get the colors and their frequencies
+        colors = kmeans.cluster_centers_.astype(int)
+        labels = kmeans.labels_
+        label_counts = np.bincount(labels)
+
+        # Sort by frequency
+        color_freq = list(zip(colors, label_counts))
+        color_freq.sort(key=lambda x: x[1], reverse=True)
+
+        return [self._rgb_to_hex(color[0]) for color in color_freq[:4]]
+
     def _basic_fallback_extraction(self, wallpaper_path: Path) -> Dict[str, str]:
         """Basic fallback using PIL only"""
         try:
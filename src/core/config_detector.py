@@ -7,13 +7,260 @@ Supports modular configs, source statements, and imports
 
 import json
 import logging
+import mmap
 import re
-from typing import Dict, List, Optional, Tuple, Any, Set
+import stat
+import sys
+import threading
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any, Set, Iterator, FrozenSet
 from pathlib import Path
 import os
 
+# RE2 (google-re2) scans in linear time; the stdlib engine backtracks
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Aho-Corasick (pyahocorasick) finds all color keywords in a single pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Color values (hex, rgb/rgba, hsl/hsla, CSS variables) matched in one pass.
+# Hex only matches the canonical 3/4/6/8 digit forms; the trailing \b keeps
+# the pattern RE2-compatible (no lookaround). Byte patterns so files can be
+# scanned straight from an mmap.
+_COLOR_PATTERN = (
+    rb'(?P<hex>#(?:[0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{4}|[0-9a-fA-F]{3})\b)'
+    rb'|(?P<rgb>rgba?\s*\(\s*[^)]+\))'
+    rb'|(?P<hsl>hsla?\s*\(\s*[^)]+\))'
+    rb'|(?P<var>var\(--[^)]+\))'
+)
+
+try:
+    _COLOR_RE = _re_engine.compile(_COLOR_PATTERN)
+except Exception:
+    _COLOR_RE = re.compile(_COLOR_PATTERN)
+
+# Files at least this large are scanned through mmap instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Directory batches below both limits skip the WILLNEED prefetch: for a few
+# small, usually cached configs the extra open/fadvise/close costs more than it hides
+_PREFETCH_MIN_FILES = 64
+_PREFETCH_MIN_BYTES = 4 * 1024 * 1024
+
+# _FileInfo content placeholder until the file is read (None means unreadable)
+_UNREAD = object()
+
+# Config file extensions per format
+_FORMAT_EXTS = {
+    "hyprland": frozenset({".conf"}),
+    "json": frozenset({".json", ".jsonc"}),
+    "rasi": frozenset({".rasi"}),
+    "kitty": frozenset({".conf"}),
+    "fish": frozenset({".fish"}),
+    "ini": frozenset({".ini", ".conf"}),
+    "css": frozenset({".css"})
+}
+
+# Include/source statement patterns per application
+_INCLUDE_RES = {
+    "hyprland": [re.compile(rb'source\s*=\s*([^\s#]+)')],
+    "rofi": [re.compile(rb'@import\s*["\']([^"\']+)["\']')],
+    "kitty": [re.compile(rb'include\s+([^\s#]+)')]
+}
+
+# Substrings every include statement contains; files without them skip the regex pass
+_INCLUDE_SENTINELS = {
+    "hyprland": (b"source",),
+    "rofi": (b"@import",),
+    "kitty": (b"include",)
+}
+
+@dataclass(slots=True)
+class _AppRuntime:
+    """Per-app detection settings, precomputed from the rule dicts for the hot path"""
+    format: str
+    include_res: Tuple[re.Pattern, ...]
+    extensions: frozenset
+    theme_sections: Tuple[str, ...]
+    backup_name: str
+    supports_includes: bool
+    always_available: bool
+    supports_discovery: bool
+    color_keywords: Tuple[str, ...] = ()
+    keyword_automaton: Optional[Any] = None
+    include_sentinels: Tuple[bytes, ...] = ()
+    
+    @classmethod
+    def from_rules(cls, app_name: str, app_config: Dict) -> "_AppRuntime":
+        return cls(
+            format=app_config["format"],
+            include_res=tuple(app_config.get("include_patterns", ())),
+            extensions=_FORMAT_EXTS.get(app_config["format"], frozenset()),
+            theme_sections=tuple(app_config.get("theme_sections", ())),
+            backup_name=app_config.get("backup_name", f"{app_name}.matyou.bak"),
+            supports_includes=app_config.get("supports_includes", False),
+            always_available=app_config.get("always_available", False),
+            supports_discovery=app_config.get("supports_discovery", False),
+            color_keywords=tuple(app_config.get("color_keywords", ())),
+            keyword_automaton=_build_keyword_automaton(app_config.get("color_keywords", ())),
+            include_sentinels=_INCLUDE_SENTINELS.get(app_name, ())
+        )
+
+def _build_keyword_automaton(keywords) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over the keywords, if pyahocorasick is available"""
+    if ahocorasick is None or not keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+@contextmanager
+def _open_content(file_path):
+    """Open a file for byte scanning: small files are read, large ones mmapped"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+def _extract_colors(data: bytes) -> List[str]:
+    """Extract color values from file content (bytes, mmap or other buffer)"""
+    # Single scan over the data; the set removes duplicates. Interning lets
+    # the same token (#000000, var(--accent)) share one str across files.
+    colors = {match.group() for match in _COLOR_RE.finditer(data)}
+    return [sys.intern(color.decode('utf-8', 'replace')) for color in colors]
+
+# A keyword only counts as a setting name: line start or whitespace before it,
+# whitespace or an assignment after it (so "background_opacity" isn't "background")
+_KEYWORD_BEFORE = b' \t\r\n'
+_KEYWORD_AFTER = b' \t\r\n=:'
+_KEYWORD_BEFORE_STR = _KEYWORD_BEFORE.decode()
+_KEYWORD_AFTER_STR = _KEYWORD_AFTER.decode()
+
+def _keyword_at_boundary(data, start: int, end: int, before, after) -> bool:
+    """Check that data[start:end] is a whole setting name (works on str, bytes and mmap)"""
+    if start > 0 and data[start - 1:start] not in before:
+        return False
+    # Slicing past the end gives an empty string, which "in" would accept
+    return end < len(data) and data[end:end + 1] in after
+
+def _find_color_keywords(data: bytes, runtime: _AppRuntime) -> List[str]:
+    """Find which of the app's color keywords are set in file content"""
+    if not runtime.color_keywords:
+        return []
+    
+    # The automaton needs str; only decode small files, which are already bytes.
+    # Copying and decoding an mmap would undo the point of mapping it
+    if runtime.keyword_automaton is not None and isinstance(data, bytes):
+        text = data.decode('utf-8', 'replace')
+        return list({keyword for end, keyword in runtime.keyword_automaton.iter(text)
+                     if _keyword_at_boundary(text, end - len(keyword) + 1, end + 1,
+                                             _KEYWORD_BEFORE_STR, _KEYWORD_AFTER_STR)})
+    
+    # Fallback (and mmap input): substring searches per keyword
+    found = []
+    for keyword in runtime.color_keywords:
+        needle = keyword.encode()
+        pos = data.find(needle)
+        while pos != -1:
+            if _keyword_at_boundary(data, pos, pos + len(needle),
+                                    _KEYWORD_BEFORE, _KEYWORD_AFTER):
+                found.append(keyword)
+                break
+            pos = data.find(needle, pos + 1)
+    return found
+
+class _FileInfo(Mapping):
+    """A found config file whose content is only read and scanned on first access
+    
+    Reads like the plain dict it replaces (config_file["path"],
+    config_file.get("color_references")), so listing configs never pays
+    for color extraction. ``content`` is None if the file can't be read
+    or decoded; consumers must not write such files.
+    """
+    __slots__ = ("path", "format", "writable", "size", "included_files",
+                 "_runtime", "_content", "_colors", "_keywords")
+    
+    _KEYS = ("path", "format", "writable", "size", "color_references",
+             "color_keywords", "content", "included_files")
+    
+    def __init__(self, path: str, runtime: _AppRuntime, writable: bool, size: int,
+                 included_files: List[str]):
+        self.path = path
+        self.format = runtime.format
+        self.writable = writable
+        self.size = size
+        self.included_files = included_files
+        self._runtime = runtime
+        self._content = _UNREAD
+        self._colors = None
+        self._keywords = None
+    
+    @property
+    def content(self) -> Optional[str]:
+        if self._content is _UNREAD:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read config file {self.path}: {e}")
+                self._content = None
+        return self._content
+    
+    @property
+    def color_references(self) -> List[str]:
+        if self._colors is None:
+            self._scan()
+        return self._colors
+    
+    @property
+    def color_keywords(self) -> List[str]:
+        if self._keywords is None:
+            self._scan()
+        return self._keywords
+    
+    def _scan(self):
+        try:
+            with _open_content(self.path) as data:
+                self._colors = _extract_colors(data)
+                self._keywords = _find_color_keywords(data, self._runtime)
+        except OSError as e:
+            logger.warning(f"Could not scan config file {self.path}: {e}")
+            self._colors = []
+            self._keywords = []
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key) -> bool:
+        # Mapping's default goes through __getitem__, which would read the file
+        return key in self._KEYS
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
 class ConfigDetector:
     """Detect and analyze application configuration files with advanced parsing"""
     
@@ -21,10 +268,16 @@ class ConfigDetector:
         self.home_dir = Path.home()
         self.config_dir = self.home_dir / ".config"
         self.app_configs = self._load_app_config_rules()
+        self._app_runtime: Dict[str, _AppRuntime] = {
+            app_name: _AppRuntime.from_rules(app_name, app_config)
+            for app_name, app_config in self.app_configs.items()
+        }
+        self._detect_cache: Dict[str, Optional[Dict]] = {}
+        self._detect_lock = threading.Lock()
     
     def _load_app_config_rules(self) -> Dict[str, Dict]:
         """Load application configuration detection rules"""
-        return {
+        rules = {
             "hyprland": {
                 "paths": [
                     "~/.config/hypr/hyprland.conf"
@@ -34,7 +287,7 @@ class ConfigDetector:
                 "color_keywords": ["col.active_border", "col.inactive_border"],
                 "backup_name": "hyprland.conf.matyou.bak",
                 "supports_includes": True,
-                "include_patterns": [r'source\s*=\s*([^\s#]+)']
+                "include_patterns": _INCLUDE_RES["hyprland"]
             },
             "waybar": {
                 "paths": [
@@ -59,7 +312,7 @@ class ConfigDetector:
                 "theme_sections": ["colors", "window", "element"],
                 "backup_name": "rofi.matyou.bak",
                 "supports_includes": True,
-                "include_patterns": [r'@import\s*["\']([^"\']+)["\']']
+                "include_patterns": _INCLUDE_RES["rofi"]
             },
             "kitty": {
                 "paths": [
@@ -70,7 +323,7 @@ class ConfigDetector:
                 "color_keywords": ["foreground", "background", "cursor"],
                 "backup_name": "kitty.conf.matyou.bak",
                 "supports_includes": True,
-                "include_patterns": [r'include\s+([^\s#]+)']
+                "include_patterns": _INCLUDE_RES["kitty"]
             },
             "fish": {
                 "paths": [
@@ -99,70 +352,107 @@ class ConfigDetector:
                 "always_available": True  # Always available for theming
             }
         }
+        
+        # Expand ~ once here so the detection hot path only sees absolute paths
+        for app_config in rules.values():
+            app_config["paths"] = [os.path.expanduser(path) for path in app_config["paths"]]
+        
+        return rules
     
     def detect_all_configs(self) -> Dict[str, Dict]:
         """Detect all supported application configurations"""
         detected_configs = {}
+        app_names = list(self.app_configs)
         
-        for app_name in self.app_configs:
-            config_info = self.detect_app_config(app_name)
-            if config_info:
-                detected_configs[app_name] = config_info
+        # Detection is mostly file I/O, so apps are scanned in parallel;
+        # detect_app_config is memoized, so repeated calls only hit the cache
+        with ThreadPoolExecutor(max_workers=min(8, len(app_names))) as executor:
+            results = executor.map(self.detect_app_config, app_names)
+            
+            for app_name, config_info in zip(app_names, results):
+                if config_info:
+                    detected_configs[app_name] = config_info
         
         return detected_configs
     
     def detect_app_config(self, app_name: str) -> Optional[Dict]:
-        """Detect configuration for a specific application with advanced parsing"""
+        """Detect configuration for a specific application (cached until invalidate())"""
         if app_name not in self.app_configs:
             logger.warning(f"Unknown application: {app_name}")
             return None
         
+        with self._detect_lock:
+            if app_name in self._detect_cache:
+                return self._detect_cache[app_name]
+        
+        # Detect outside the lock so different apps can be scanned concurrently
+        config_info = self._detect_app_config_uncached(app_name)
+        
+        with self._detect_lock:
+            return self._detect_cache.setdefault(app_name, config_info)
+    
+    def invalidate(self, app_name: Optional[str] = None):
+        """Drop cached detection results for one application, or all of them"""
+        with self._detect_lock:
+            if app_name is None:
+                self._detect_cache.clear()
+            else:
+                self._detect_cache.pop(app_name, None)
+    
+    def _detect_app_config_uncached(self, app_name: str) -> Optional[Dict]:
+        """Detect configuration for a specific application with advanced parsing"""
         app_config = self.app_configs[app_name]
+        runtime = self._app_runtime[app_name]
         
         # Handle always available apps (like GTK that generate themes dynamically)
-        if app_config.get("always_available", False):
+        if runtime.always_available:
             return {
                 "app": app_name,
-                "format": app_config["format"],
+                "format": runtime.format,
                 "found_configs": [{
                     "path": "generated",
-                    "format": app_config["format"],
+                    "format": runtime.format,
                     "writable": True,
                     "type": "generated",
                     "is_generated": True
                 }],
-                "theme_sections": app_config.get("theme_sections", []),
-                "backup_name": app_config.get("backup_name", f"{app_name}.matyou.bak"),
+                "theme_sections": list(runtime.theme_sections),
+                "backup_name": runtime.backup_name,
                 "dependency_graph": {},
                 "is_generated": True
             }
         
         # Use advanced discovery for supported apps
-        if app_config.get("supports_discovery", False):
+        if runtime.supports_discovery:
             return self._advanced_discovery(app_name, app_config)
         
         # Standard detection with include parsing
         config_info = {
             "app": app_name,
-            "format": app_config["format"],
+            "format": runtime.format,
             "found_configs": [],
-            "theme_sections": app_config.get("theme_sections", []),
-            "backup_name": app_config.get("backup_name", f"{app_name}.matyou.bak"),
+            "theme_sections": list(runtime.theme_sections),
+            "backup_name": runtime.backup_name,
             "dependency_graph": {}
         }
         
         discovered_files = set()
         
-        # Check each possible path
-        for path_pattern in app_config["paths"]:
-            path = Path(path_pattern.replace("~", str(self.home_dir)))
+        # Check each possible path (one stat classifies it and is reused for the file info)
+        for path_str in app_config["paths"]:
+            try:
+                path_stat = os.stat(path_str)
+            except OSError:
+                continue
             
-            if path.is_dir():
+            path = Path(path_str)
+            if stat.S_ISDIR(path_stat.st_mode):
                 # Handle directory paths (scan for config files)
-                self._scan_config_directory(path, app_config, config_info, discovered_files)
-            elif path.exists():
+                self._scan_config_directory(path, runtime, config_info, discovered_files)
+            else:
                 # Handle single file paths
-                self._analyze_config_file_recursive(path, app_config, config_info, discovered_files)
+                self._analyze_config_graph(path, runtime, config_info, discovered_files,
+                                           file_stat=path_stat)
         
         return config_info if config_info["found_configs"] else None
     
@@ -222,122 +512,188 @@ class ConfigDetector:
             logger.error(f"Error in advanced waybar discovery: {e}")
             return None
     
-    def _scan_config_directory(self, directory: Path, app_config: Dict, 
+    def _scan_config_directory(self, directory: Path, runtime: _AppRuntime, 
                               config_info: Dict, discovered_files: Set[str]):
         """Scan a directory for configuration files"""
         try:
-            for item in directory.rglob("*"):
-                if item.is_file() and self._looks_like_config_file(item, app_config):
-                    self._analyze_config_file_recursive(item, app_config, config_info, discovered_files)
+            candidates = list(self._walk_files(directory, runtime.extensions))
+            
+            # DirEntry caches the stat, so this is usually free
+            stated = []
+            for entry in candidates:
+                try:
+                    stated.append((entry, entry.stat()))
+                except OSError:
+                    continue
+            
+            # Let the kernel read a large batch ahead while we parse serially;
+            # only apps with include support read file contents during detection
+            if runtime.supports_includes and (
+                    len(stated) >= _PREFETCH_MIN_FILES or
+                    sum(entry_stat.st_size for _, entry_stat in stated) >= _PREFETCH_MIN_BYTES):
+                self._prefetch_files([entry.path for entry, _ in stated])
+            
+            for entry, entry_stat in stated:
+                self._analyze_config_graph(Path(entry.path), runtime, config_info,
+                                           discovered_files, file_stat=entry_stat)
         except Exception as e:
             logger.warning(f"Error scanning directory {directory}: {e}")
     
-    def _looks_like_config_file(self, file_path: Path, app_config: Dict) -> bool:
-        """Check if a file looks like a configuration file for the app"""
-        format_type = app_config["format"]
-        
-        format_extensions = {
-            "hyprland": [".conf"],
-            "json": [".json", ".jsonc"],
-            "rasi": [".rasi"],
-            "kitty": [".conf"],
-            "fish": [".fish"],
-            "ini": [".ini", ".conf"],
-            "css": [".css"]
-        }
+    def _prefetch_files(self, paths: List[str]):
+        """Hint the kernel to start reading files in the background (POSIX_FADV_WILLNEED)"""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def _walk_files(self, root: Path, allowed: FrozenSet[str]) -> Iterator[os.DirEntry]:
+        """Yield files below root whose lower-cased suffix is one of the allowed extensions"""
+        stack = [os.fspath(root)]
         
-        valid_extensions = format_extensions.get(format_type, [])
-        return file_path.suffix.lower() in valid_extensions
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Like rglob, don't descend into symlinked directories; skip .git and friends
+                        if entry.is_dir(follow_symlinks=False):
+                            if name[0] != '.':
+                                stack.append(entry.path)
+                        elif self._suffix_allowed(name, allowed) and entry.is_file():
+                            yield entry
+            except OSError as e:
+                logger.warning(f"Error scanning directory {current}: {e}")
+    
+    def _suffix_allowed(self, name: str, allowed: FrozenSet[str]) -> bool:
+        """Case-insensitive suffix check, like Path.suffix.lower() in allowed"""
+        dot = name.rfind('.')
+        # dot == 0 is a dotfile like ".conf", which Path.suffix treats as having no suffix
+        if dot <= 0:
+            return False
+        return name[dot:].lower() in allowed
+    
+    def _analyze_config_graph(self, root_path: Path, runtime: _AppRuntime, 
+                              config_info: Dict, discovered_files: Set[str],
+                              file_stat: Optional[os.stat_result] = None):
+        """Analyze a config file and everything it includes, breadth-first
+        
+        ``file_stat`` is the root file's stat result when the caller already
+        has one (directory scan or path check), so existence, size and
+        writability cost no extra syscalls.
+        """
+        dependency_graph = config_info["dependency_graph"]
+        queue = deque([(root_path, file_stat)])
+        
+        while queue:
+            file_path, known_stat = queue.popleft()
+            included_files = self._analyze_config_file(file_path, runtime, config_info,
+                                                       discovered_files, known_stat)
+            
+            parent = str(file_path)
+            for included_file in included_files:
+                included_str = str(included_file)
+                dependency_graph.setdefault(parent, []).append(included_str)
+                
+                # Shared includes (e.g. a palette imported by siblings) are analyzed once
+                if included_str not in discovered_files:
+                    queue.append((included_file, None))
     
-    def _analyze_config_file_recursive(self, file_path: Path, app_config: Dict, 
-                                     config_info: Dict, discovered_files: Set[str]):
-        """Analyze a config file and recursively follow includes"""
+    def _analyze_config_file(self, file_path: Path, runtime: _AppRuntime, config_info: Dict,
+                             discovered_files: Set[str],
+                             file_stat: Optional[os.stat_result] = None) -> List[Path]:
+        """Analyze a single config file and return the files it includes"""
         file_path_str = str(file_path)
         
-        if file_path_str in discovered_files or not file_path.exists():
-            return
+        if file_path_str in discovered_files:
+            return []
+        
+        if file_stat is None:
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                return []
         
         discovered_files.add(file_path_str)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Only include scanning happens now; colors and content are
+            # read lazily by _FileInfo when a consumer asks for them
+            included_files = []
+            if runtime.supports_includes:
+                with _open_content(file_path) as content:
+                    included_files = self._find_included_files(content, file_path, runtime,
+                                                               discovered_files)
             
-            file_info = {
-                "path": file_path_str,
-                "format": app_config["format"],
-                "writable": os.access(file_path, os.W_OK),
-                "size": file_path.stat().st_size,
-                "color_references": self._extract_colors_from_string(content),
-                "content": content,
-                "included_files": []
-            }
+            file_info = _FileInfo(
+                file_path_str,
+                runtime,
+                writable=self._is_writable(file_path, file_stat),
+                size=file_stat.st_size,
+                included_files=[str(f) for f in included_files]
+            )
             
             config_info["found_configs"].append(file_info)
-            
-            # Follow includes if supported
-            if app_config.get("supports_includes", False):
-                included_files = self._find_included_files(content, file_path, app_config)
-                file_info["included_files"] = [str(f) for f in included_files]
-                
-                # Recursively analyze included files
-                for included_file in included_files:
-                    self._analyze_config_file_recursive(included_file, app_config, config_info, discovered_files)
-                    
-                    # Build dependency graph
-                    if file_path_str not in config_info["dependency_graph"]:
-                        config_info["dependency_graph"][file_path_str] = []
-                    config_info["dependency_graph"][file_path_str].append(str(included_file))
+            return included_files
             
         except Exception as e:
             logger.error(f"Error analyzing config file {file_path}: {e}")
+            return []
     
-    def _find_included_files(self, content: str, base_file: Path, app_config: Dict) -> List[Path]:
-        """Find files included by source/import statements"""
+    def _is_writable(self, file_path: Path, file_stat: os.stat_result) -> bool:
+        """Check writability from a stat result, asking the kernel only if we don't own the file"""
+        if file_stat.st_uid == os.geteuid():
+            return bool(file_stat.st_mode & stat.S_IWUSR)
+        return os.access(file_path, os.W_OK)
+    
+    def _find_included_files(self, content: bytes, base_file: Path, runtime: _AppRuntime,
+                             known_files: Set[str] = frozenset()) -> List[Path]:
+        """Find files included by source/import statements (normalized, deduplicated)"""
+        # A plain substring search is far cheaper than running the regexes for nothing
+        sentinels = runtime.include_sentinels
+        if sentinels and not any(content.find(sentinel) != -1 for sentinel in sentinels):
+            return []
+        
         included_files = []
-        include_patterns = app_config.get("include_patterns", [])
+        seen = set()
+        base_dir = os.fspath(base_file.parent)
         
-        for pattern in include_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in runtime.include_res:
+            matches = pattern.findall(content)
             
-            for match in matches:
-                # Resolve relative paths
+            for raw_match in matches:
+                match = os.fsdecode(raw_match)
+                
+                # Resolve relative paths (os.path.join keeps absolute ones as-is)
                 if match.startswith('~'):
-                    included_path = Path(match.replace("~", str(self.home_dir)))
-                elif match.startswith('/'):
-                    included_path = Path(match)
+                    raw_path = os.path.expanduser(match)
                 else:
-                    included_path = base_file.parent / match
+                    raw_path = os.path.join(base_dir, match)
+                
+                key = os.path.normpath(raw_path)
+                if key in seen:
+                    continue
+                seen.add(key)
                 
-                if included_path.exists():
-                    included_files.append(included_path)
+                # Already-analyzed files are known to exist, skip the stat
+                if key in known_files or os.path.exists(key):
+                    included_files.append(Path(key))
                 else:
-                    logger.warning(f"Included file not found: {included_path}")
+                    logger.warning(f"Included file not found: {key}")
         
         return included_files
     
-    def _extract_colors_from_string(self, text: str) -> List[str]:
-        """Extract color values from a string"""
-        colors = []
-        
-        # Hex colors
-        hex_pattern = r'#[0-9a-fA-F]{3,8}\b'
-        colors.extend(re.findall(hex_pattern, text))
-        
-        # RGB/RGBA colors
-        rgb_pattern = r'rgba?\s*\(\s*[^)]+\)'
-        colors.extend(re.findall(rgb_pattern, text))
-        
-        # HSL colors
-        hsl_pattern = r'hsla?\s*\(\s*[^)]+\)'
-        colors.extend(re.findall(hsl_pattern, text))
-        
-        # CSS variables (might contain colors)
-        css_var_pattern = r'var\(--[^)]+\)'
-        colors.extend(re.findall(css_var_pattern, text))
-        
-        return list(set(colors))  # Remove duplicates
-    
     def get_config_dependencies(self, app_name: str) -> Dict[str, List[str]]:
         """Get dependency graph for an application's configs"""
         config_info = self.detect_app_config(app_name)
@@ -354,7 +710,7 @@ class ConfigDetector:
         color_files = []
         
         for config_file in config_info["found_configs"]:
-            if config_file.get("color_references"):
+            if config_file.get("color_references") or config_file.get("color_keywords"):
                 color_files.append(config_file["path"])
         
         return color_files
@@ -383,4 +739,7 @@ class ConfigDetector:
                 if config_file.get("type") == "css":
                     summary["waybar_instances"][instance]["css_files"] += 1
                 else:
-                    summary["waybar_instances"][instance]["config_files"] += 1 
\ No newline at end of file
+                    summary["waybar_instances"][instance]["config_files"] += 1
+        
+        return summary
+ 
\ No newline at end of file
@@ -5,12 +5,13 @@ Main orchestrator for applying Material You themes across applications
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 from .config_detector import ConfigDetector
 from .color_extractor import MaterialYouColorExtractor  
-from .ai_models import OllamaManager, ConfigGenerator
 from ..utils.backup import ConfigBackupManager
 from ..apps.hyprland import HyprlandThemer
 from ..apps.kitty import KittyThemer
@@ -21,6 +22,20 @@ from ..apps.gtk import GTKThemer
 
 logger = logging.getLogger(__name__)
 
+# Apps whose configs are commonly split over several files
+_MODULAR_CAPABLE = frozenset({"hyprland", "waybar"})
+
+# Seconds to trust a "models available" answer from Ollama
+_AI_MODELS_TTL = 30
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex6(value: str) -> bool:
+    """Check for a #RRGGBB color without going through the regex engine"""
+    # int(value[1:], 16) would also accept whitespace, signs and underscores
+    return len(value) == 7 and value[0] == '#' and _HEX_DIGITS.issuperset(value[1:])
+
 class ThemeApplicator:
     """Main theme application orchestrator (handles complex configurations)"""
     
@@ -28,8 +43,11 @@ class ThemeApplicator:
         self.config_detector = ConfigDetector()
         self.color_extractor = MaterialYouColorExtractor()
         self.backup_manager = ConfigBackupManager()
-        self.ollama_manager = OllamaManager()
-        self.config_generator = ConfigGenerator(self.ollama_manager)
+        # AI helpers are only needed for the fallback path, created on first use
+        self._ollama = None
+        self._cfggen = None
+        self._models_cache_val = False
+        self._models_cache_ts: Optional[float] = None
         
         # Register all application themers
         self.themers = {
@@ -41,17 +59,79 @@ class ThemeApplicator:
             "gtk": GTKThemer()
         }
         
+        # Resolve each themer's reload method once instead of probing on every apply
+        self._reload_fns = {}
+        for name, themer in self.themers.items():
+            for method in ("reload_waybar", "reload_config", "reload_dunst", "reload_rofi"):
+                if hasattr(themer, method):
+                    self._reload_fns[name] = getattr(themer, method)
+                    break
+        
         # Track which apps have modular configs
         self.modular_apps = set()
+        
+        # Detection results shared by all entry points until invalidated
+        self._configs_cache: Optional[Dict[str, Dict]] = None
+        self._modular_summary_cache: Dict[str, Dict] = {}
+    
+    @property
+    def ollama_manager(self):
+        """Ollama manager, created on first access"""
+        if self._ollama is None:
+            from .ai_models import OllamaManager
+            self._ollama = OllamaManager()
+        return self._ollama
+    
+    @property
+    def config_generator(self):
+        """AI config generator, created on first access"""
+        if self._cfggen is None:
+            from .ai_models import ConfigGenerator
+            self._cfggen = ConfigGenerator(self.ollama_manager)
+        return self._cfggen
+    
+    def _have_ai_models(self) -> bool:
+        """Check for installed Ollama models, remembering the answer for a short while"""
+        now = time.monotonic()
+        if self._models_cache_ts is not None and now - self._models_cache_ts < _AI_MODELS_TTL:
+            return self._models_cache_val
+        
+        self._models_cache_val = bool(self.ollama_manager.list_models())
+        self._models_cache_ts = now
+        return self._models_cache_val
+    
+    def _get_all_configs(self, refresh: bool = False) -> Dict[str, Dict]:
+        """Get detected configurations, scanning the filesystem only once"""
+        if refresh or self._configs_cache is None:
+            if refresh:
+                self.config_detector.invalidate()
+            self._configs_cache = self.config_detector.detect_all_configs()
+            self._modular_summary_cache.clear()
+        return self._configs_cache
+    
+    def _get_modular_summary(self, app_name: str) -> Dict[str, Any]:
+        """Get the (cached) modular config summary for an application"""
+        summary = self._modular_summary_cache.get(app_name)
+        if summary is None:
+            summary = self.config_detector.get_modular_config_summary(app_name)
+            self._modular_summary_cache[app_name] = summary
+        return summary
+    
+    def invalidate_config_cache(self):
+        """Forget detected configurations so the next call rescans"""
+        self._configs_cache = None
+        self._modular_summary_cache.clear()
+        self.config_detector.invalidate()
     
     def apply_theme_from_wallpaper(self, wallpaper_path: str, apps: Optional[List[str]] = None, 
-                                  preview_mode: bool = False, theme_name: Optional[str] = None) -> Dict[str, Any]:
-        """Apply Material You theme extracted from wallpaper"""
+                                  preview_mode: bool = False, theme_name: Optional[str] = None,
+                                  precomputed_palette: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Apply Material You theme extracted from wallpaper (or a palette already extracted from it)"""
         try:
             logger.info(f"Applying theme from wallpaper: {wallpaper_path}")
             
-            # Extract color palette from wallpaper
-            color_palette = self.color_extractor.extract_palette(Path(wallpaper_path))
+            # Extract color palette from wallpaper unless the caller already did
+            color_palette = precomputed_palette or self.color_extractor.extract_palette(Path(wallpaper_path))
             
             if not color_palette:
                 return {"success": False, "error": "Failed to extract colors from wallpaper"}
@@ -68,7 +148,7 @@ class ThemeApplicator:
         """Apply Material You theme to specified applications (handles modular configs)"""
         try:
             # Detect all configurations
-            all_configs = self.config_detector.detect_all_configs()
+            all_configs = self._get_all_configs()
             
             if not all_configs:
                 return {"success": False, "error": "No supported application configurations found"}
@@ -90,8 +170,17 @@ class ThemeApplicator:
             # Create backup snapshot if not in preview mode
             if not preview_mode and theme_name:
                 try:
+                    # Generated entries (e.g. GTK's "generated") are not files on disk
+                    applied_configs = {}
+                    for app_name in target_apps:
+                        if app_name not in all_configs:
+                            continue
+                        paths = [f["path"] for f in all_configs[app_name]["found_configs"]
+                                 if not f.get("is_generated")]
+                        if paths:
+                            applied_configs[app_name] = paths
                     snapshot_id = self.backup_manager.create_theme_snapshot(
-                        theme_name, all_configs, color_palette
+                        theme_name, color_palette, applied_configs
                     )
                     results["snapshot_id"] = snapshot_id
                     logger.info(f"Created theme snapshot: {snapshot_id}")
@@ -111,8 +200,8 @@ class ThemeApplicator:
                 
                 try:
                     # Log modular configuration information
-                    if app_name in ["hyprland", "waybar"]:
-                        modular_summary = self.config_detector.get_modular_config_summary(app_name)
+                    if app_name in _MODULAR_CAPABLE:
+                        modular_summary = self._get_modular_summary(app_name)
                         results["modular_configs"][app_name] = modular_summary
                         
                         if modular_summary.get("total_files", 0) > 1:
@@ -147,6 +236,10 @@ class ThemeApplicator:
             if results["success"] and not preview_mode:
                 self._reload_applications(results["applied_apps"])
             
+            # Config files were rewritten, so cached contents and colors are stale
+            if not preview_mode:
+                self.invalidate_config_cache()
+            
             return results
             
         except Exception as e:
@@ -170,9 +263,8 @@ class ThemeApplicator:
                            config_info: Dict, preview_mode: bool) -> bool:
         """Fallback method using AI to generate config patches"""
         try:
-            # Check if any models are available 
-            models = self.ollama_manager.list_models()
-            if not models:
+            # Check if any models are available (shared by all apps in one apply)
+            if not self._have_ai_models():
                 logger.warning("AI fallback not available - no Ollama models found")
                 return False
             
@@ -184,7 +276,11 @@ class ThemeApplicator:
                 
                 try:
                     # Use ConfigGenerator to create the patch
-                    current_config = config_file.get("content", "")
+                    current_config = config_file.get("content")
+                    if current_config is None:
+                        # Unreadable or undecodable: a patch would replace data we never saw
+                        logger.warning(f"Skipping AI patch for unreadable {config_file['path']}")
+                        continue
                     config_format = config_file.get("format", "unknown")
                     
                     ai_patch = self.config_generator.generate_config_patch(
@@ -193,8 +289,7 @@ class ThemeApplicator:
                     
                     if ai_patch and not preview_mode:
                         # Apply the AI-generated patch
-                        with open(config_file["path"], 'w') as f:
-                            f.write(ai_patch)
+                        Path(config_file["path"]).write_text(ai_patch)
                         success_count += 1
                         
                     elif ai_patch and preview_mode:
@@ -212,25 +307,20 @@ class ThemeApplicator:
     
     def _reload_applications(self, applied_apps: List[Dict]) -> None:
         """Reload applications after theme changes"""
-        for app_info in applied_apps:
-            app_name = app_info["app"]
-            
+        reloads = [(app_info["app"], self._reload_fns[app_info["app"]]) 
+                   for app_info in applied_apps if app_info["app"] in self._reload_fns]
+        
+        def reload(job):
+            app_name, reload_fn = job
             try:
-                if app_name in self.themers:
-                    themer = self.themers[app_name]
-                    
-                    # Call reload method if available
-                    if hasattr(themer, 'reload_waybar'):
-                        themer.reload_waybar()
-                    elif hasattr(themer, 'reload_config'):
-                        themer.reload_config()
-                    elif hasattr(themer, 'reload_dunst'):
-                        themer.reload_dunst()
-                    elif hasattr(themer, 'reload_rofi'):
-                        themer.reload_rofi()
-                        
+                reload_fn()
             except Exception as e:
                 logger.warning(f"Failed to reload {app_name}: {e}")
+        
+        # Reloads are independent subprocess calls (hyprctl, pkill, ...), run them together
+        if reloads:
+            with ThreadPoolExecutor(max_workers=len(reloads)) as executor:
+                list(executor.map(reload, reloads))
     
     def preview_theme(self, color_palette: Dict[str, str], apps: Optional[List[str]] = None) -> Dict[str, Any]:
         """Preview theme changes without applying them"""
@@ -242,17 +332,20 @@ class ThemeApplicator:
     
     def get_detected_applications(self) -> Dict[str, Dict]:
         """Get detected application configurations with modular info"""
-        all_configs = self.config_detector.detect_all_configs()
-        
-        enhanced_configs = {}
-        for app_name, config_info in all_configs.items():
-            enhanced_configs[app_name] = {
-                **config_info,
+        return {
+            app_name: config_info | {
                 "has_themer": app_name in self.themers,
-                "modular_summary": self.config_detector.get_modular_config_summary(app_name)
+                "modular_summary": self._get_modular_summary(app_name)
             }
-        
-        return enhanced_configs
+            for app_name, config_info in self._get_all_configs().items()
+        }
+    
+    def get_detected_applications_light(self) -> Dict[str, Tuple[bool, Dict]]:
+        """Get (has_themer, modular_summary) per detected application without copying config info"""
+        return {
+            app_name: (app_name in self.themers, self._get_modular_summary(app_name))
+            for app_name in self._get_all_configs()
+        }
     
     def validate_color_palette(self, color_palette: Dict[str, str]) -> Dict[str, Any]:
         """Validate a Material You color palette"""
@@ -275,11 +368,8 @@ class ThemeApplicator:
                 validation["valid"] = False
         
         # Validate color format
-        import re
-        hex_pattern = re.compile(r'^#[0-9a-fA-F]{6}$')
-        
         for color_key, color_value in color_palette.items():
-            if not hex_pattern.match(color_value):
+            if not _is_hex6(color_value):
                 validation["invalid_colors"].append({
                     "key": color_key,
                     "value": color_value,
@@ -308,11 +398,11 @@ class ThemeApplicator:
             "recommendations": []
         }
         
-        all_configs = self.config_detector.detect_all_configs()
+        all_configs = self._get_all_configs()
         analysis["total_apps"] = len(all_configs)
         
         for app_name, config_info in all_configs.items():
-            summary = self.config_detector.get_modular_config_summary(app_name)
+            summary = self._get_modular_summary(app_name)
             
             is_modular = summary.get("total_files", 0) > 1
             
@@ -6,14 +6,49 @@ Handles safe backup and restoration of configuration files
 
 import json
 import logging
+import os
 import shutil
+import stat
 import datetime
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import hashlib
 
+# orjson (de)serializes several times faster than the stdlib json module
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _loads(data: bytes):
+        return json.loads(data)
+
+# xxHash (XXH3) is a much faster non-cryptographic checksum than CRC32/SHA-256
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after a metadata change before rewriting the metadata file,
+# so a burst of changes (one theme apply) costs a single rewrite
+_FLUSH_DELAY = 0.5
+
+# Number of full snapshot records kept in memory
+_SNAPSHOT_CACHE_SIZE = 8
+
 class ConfigBackupManager:
     """Manages backups and versioning of configuration files"""
     
@@ -22,14 +57,33 @@ class ConfigBackupManager:
         self.backup_dir = backup_dir or (self.home_dir / ".config" / "matyouai" / "backups")
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.backup_dir / "backup_metadata.json"
+        self.events_file = self.backup_dir / "backup_events.jsonl"
+        # Full snapshot records live here; metadata only keeps a small index entry
+        self.snapshots_dir = self.backup_dir / "snapshots"
+        self.snapshots_dir.mkdir(exist_ok=True)
+        self._snapshot_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        # Guards metadata and the event log; backups may be created from worker threads
+        self._meta_lock = threading.RLock()
+        self._reserved_ids = set()
         self.metadata = self._load_metadata()
+        
+        # Secondary index: app name -> backup ids, kept in sync by _apply_event
+        self._by_app: Dict[str, List[str]] = defaultdict(list)
+        for backup_id, backup_info in self.metadata["backups"].items():
+            self._by_app[backup_info["app"]].append(backup_id)
+        
+        # Replayed events are only in the log until the next flush, so compact soon
+        self._flush_timer: Optional[threading.Timer] = None
+        self._dirty = self._replay_events() > 0
+        if self._dirty:
+            self._schedule_flush()
     
     def _load_metadata(self) -> Dict:
         """Load backup metadata"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                with open(self.metadata_file, 'rb') as f:
+                    return _loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading backup metadata: {e}")
         
@@ -40,13 +94,115 @@ class ConfigBackupManager:
         }
     
     def _save_metadata(self):
-        """Save backup metadata"""
+        """Save backup metadata (compacts the event log into the metadata file)"""
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            with self._meta_lock:
+                # Write aside and rename so a crash never leaves a truncated metadata file
+                tmp_file = self.metadata_file.with_suffix(".json.tmp")
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(self.metadata))
+                os.replace(tmp_file, self.metadata_file)
+                
+                # Everything in the log is now part of the metadata file
+                open(self.events_file, 'w').close()
+                self._dirty = False
         except Exception as e:
             logger.error(f"Error saving backup metadata: {e}")
     
+    def _replay_events(self) -> int:
+        """Apply events logged since the last compaction, returns how many were read"""
+        count = 0
+        try:
+            with open(self.events_file, 'rb') as f:
+                for line in f:
+                    try:
+                        self._apply_event(_loads(line))
+                        count += 1
+                    except (ValueError, KeyError) as e:
+                        # A torn last line after a crash is expected, skip it
+                        logger.warning(f"Skipping bad backup event: {e}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error replaying backup events: {e}")
+        
+        return count
+    
+    def _apply_event(self, event: Dict):
+        """Apply a single metadata change (shared by live updates and replay)"""
+        op = event["op"]
+        
+        if op == "add_backup":
+            backup_id = event["id"]
+            if backup_id not in self.metadata["backups"]:
+                self._by_app[event["info"]["app"]].append(backup_id)
+            self.metadata["backups"][backup_id] = event["info"]
+        elif op == "remove_backup":
+            backup_info = self.metadata["backups"].pop(event["id"], None)
+            if backup_info is not None:
+                self._by_app[backup_info["app"]].remove(event["id"])
+        elif op == "snapshot":
+            theme_info = event["theme"]
+            # Replaying a log that was already compacted must not duplicate history
+            if not any(t["snapshot_id"] == theme_info["snapshot_id"] 
+                       for t in self.metadata["theme_history"]):
+                self.metadata["theme_history"].append(theme_info)
+            self.metadata["current_theme"] = theme_info
+        elif op == "set_current_theme":
+            self.metadata["current_theme"] = event["theme"]
+        else:
+            raise KeyError(f"unknown op {op}")
+    
+    def _record_event(self, event: Dict):
+        """Apply a metadata change in memory and append it to the event log"""
+        with self._meta_lock:
+            self._apply_event(event)
+            
+            self._dirty = True
+            
+            try:
+                with open(self.events_file, 'ab') as f:
+                    f.write(_dumps(event) + b'\n')
+            except Exception as e:
+                # Not in the log, so don't wait for the debounce to persist it
+                logger.error(f"Error logging backup event: {e}")
+                self._save_metadata()
+                return
+            
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Rewrite the metadata file shortly, unless a rewrite is already pending"""
+        with self._meta_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_DELAY, self._flush_metadata)
+                # The event log is durable, so a pending flush must not keep the process alive
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_metadata(self):
+        """Timer callback: compact the event log into the metadata file"""
+        with self._meta_lock:
+            self._flush_timer = None
+            if self._dirty:
+                self._save_metadata()
+    
+    def close(self):
+        """Cancel any pending flush and compact pending events into the metadata file"""
+        with self._meta_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if self._dirty:
+                self._save_metadata()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def create_backup(self, file_path: str, app_name: str, reason: str = "auto") -> Optional[str]:
         """Create a backup of a configuration file"""
         try:
@@ -55,17 +211,53 @@ class ConfigBackupManager:
                 logger.error(f"Source file not found: {file_path}")
                 return None
             
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{app_name}_{timestamp}_{reason}.backup"
+            now = datetime.datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            backup_id = self._reserve_backup_id(f"{app_name}_{timestamp}")
+        except Exception as e:
+            logger.error(f"Error creating backup for {file_path}: {e}")
+            return None
+        
+        try:
+            backup_filename = f"{backup_id}_{reason}.backup"
             backup_path = self.backup_dir / backup_filename
             
-            shutil.copy2(source_path, backup_path)
+            # Single pass over the source: copy and hash the same buffers
+            file_hash, content_crc, file_size = self._copy_and_hash(source_path, backup_path)
+            
+            self._record_event({"op": "add_backup", "id": backup_id, "info": {
+                "app": app_name,
+                "original_path": str(source_path),
+                "backup_path": str(backup_path),
+                "timestamp": timestamp,
+                "ts_epoch": int(now.timestamp()),
+                "readable_time": now.isoformat(sep=' ', timespec='seconds'),
+                "reason": reason,
+                "file_size": file_size,
+                "file_hash": file_hash,
+                "content_crc": content_crc
+            }})
             logger.info(f"Created backup: {backup_path}")
-            return f"{app_name}_{timestamp}"
+            return backup_id
             
         except Exception as e:
             logger.error(f"Error creating backup for {file_path}: {e}")
             return None
+        finally:
+            with self._meta_lock:
+                self._reserved_ids.discard(backup_id)
+    
+    def _reserve_backup_id(self, base_id: str) -> str:
+        """Pick an unused backup id (several files of one app can be backed up per second)"""
+        with self._meta_lock:
+            backup_id = base_id
+            suffix = 1
+            while backup_id in self.metadata["backups"] or backup_id in self._reserved_ids:
+                suffix += 1
+                backup_id = f"{base_id}_{suffix}"
+            
+            self._reserved_ids.add(backup_id)
+            return backup_id
     
     def restore_backup(self, backup_id: str, create_current_backup: bool = True) -> bool:
         """Restore a configuration file from backup"""
@@ -87,16 +279,30 @@ class ConfigBackupManager:
                 self.create_backup(str(original_path), backup_info["app"], "pre_restore")
             
             # Restore the backup
-            shutil.copy2(backup_path, original_path)
+            self._fast_copy(backup_path, original_path)
             
-            # Verify integrity
-            restored_hash = self._calculate_file_hash(original_path)
-            if restored_hash == backup_info["file_hash"]:
-                logger.info(f"Successfully restored backup: {backup_id}")
-                return True
-            else:
-                logger.warning(f"Hash mismatch after restore: {backup_id}")
+            # Verify integrity: a size check is enough for a local copy, full hash only on request
+            expected_size = backup_info.get("file_size", backup_path.stat().st_size)
+            if original_path.stat().st_size != expected_size:
+                logger.warning(f"Size mismatch after restore: {backup_id}")
                 return False
+            
+            if os.environ.get("MATYOUAI_PARANOID_RESTORE") == "1":
+                restored_hash = self._calculate_file_hash(original_path)
+                if restored_hash != backup_info["file_hash"]:
+                    logger.warning(f"Hash mismatch after restore: {backup_id}")
+                    return False
+            elif "content_crc" in backup_info:
+                # Cheap content check; only comparable if recorded with the same algorithm
+                expected_crc = backup_info["content_crc"]
+                restored_crc = self._calculate_file_crc(original_path)
+                if (restored_crc.split(":", 1)[0] == expected_crc.split(":", 1)[0]
+                        and restored_crc != expected_crc):
+                    logger.warning(f"Checksum mismatch after restore: {backup_id}")
+                    return False
+            
+            logger.info(f"Successfully restored backup: {backup_id}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error restoring backup {backup_id}: {e}")
@@ -105,20 +311,27 @@ class ConfigBackupManager:
     def list_backups(self, app_name: Optional[str] = None) -> List[Dict]:
         """List available backups"""
         backups = []
+        all_backups = self.metadata["backups"]
         
-        for backup_id, backup_info in self.metadata["backups"].items():
-            if app_name is None or backup_info["app"] == app_name:
-                backup_info_copy = backup_info.copy()
-                backup_info_copy["backup_id"] = backup_id
-                
-                # Add human-readable timestamp
+        if app_name is None:
+            backup_ids = all_backups.keys()
+        else:
+            backup_ids = self._by_app.get(app_name, ())
+        
+        for backup_id in backup_ids:
+            backup_info = all_backups[backup_id]
+            backup_info_copy = backup_info.copy()
+            backup_info_copy["backup_id"] = backup_id
+            
+            # Add human-readable timestamp (precomputed for backups made by this version)
+            if "readable_time" not in backup_info:
                 try:
                     dt = datetime.datetime.strptime(backup_info["timestamp"], "%Y%m%d_%H%M%S")
                     backup_info_copy["readable_time"] = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
+                except (KeyError, ValueError):
                     backup_info_copy["readable_time"] = backup_info["timestamp"]
-                
-                backups.append(backup_info_copy)
+            
+            backups.append(backup_info_copy)
         
         # Sort by timestamp (newest first)
         backups.sort(key=lambda x: x["timestamp"], reverse=True)
@@ -128,41 +341,45 @@ class ConfigBackupManager:
         """Clean up old backups based on count and age"""
         removed_count = 0
         cutoff_date = datetime.datetime.now() - datetime.timedelta(days=keep_days)
+        cutoff_epoch = int(cutoff_date.timestamp())
         
-        # Group backups by app
-        app_backups = {}
-        for backup_id, backup_info in self.metadata["backups"].items():
-            app = backup_info["app"]
-            if app not in app_backups:
-                app_backups[app] = []
-            app_backups[app].append((backup_id, backup_info))
-        
-        # Process each app's backups
-        for app, backups in app_backups.items():
-            # Sort by timestamp (newest first)
-            backups.sort(key=lambda x: x[1]["timestamp"], reverse=True)
+        # Process each app's backups (copied, _remove_backup updates the index)
+        for app, backup_ids in list(self._by_app.items()):
+            backups = [(backup_id, self.metadata["backups"][backup_id]) for backup_id in backup_ids]
+            
+            # Sort by timestamp, then creation order within the second (newest first)
+            backups.sort(key=self._backup_sort_key, reverse=True)
             
-            # Keep specified number of newest backups
-            to_remove = backups[keep_count:]
+            # Remove everything past the newest keep_count, plus anything older than the cutoff
+            keep_ids = {backup_id for backup_id, _ in backups[:keep_count]}
             
-            # Also remove old backups beyond the day threshold
             for backup_id, backup_info in backups:
-                try:
-                    backup_dt = datetime.datetime.strptime(backup_info["timestamp"], "%Y%m%d_%H%M%S")
-                    if backup_dt < cutoff_date and (backup_id, backup_info) not in to_remove:
-                        to_remove.append((backup_id, backup_info))
-                except:
+                if backup_id in keep_ids and not self._is_older_than(backup_info, cutoff_epoch):
                     continue
-            
-            # Remove the selected backups
-            for backup_id, backup_info in to_remove:
+                
                 if self._remove_backup(backup_id):
                     removed_count += 1
         
-        self._save_metadata()
         logger.info(f"Cleaned up {removed_count} old backups")
         return removed_count
     
+    def _backup_sort_key(self, item: Tuple[str, Dict]) -> Tuple[str, int]:
+        """Order key for (backup_id, info): timestamp, then the _N suffix added by _reserve_backup_id"""
+        backup_id, backup_info = item
+        base_id = f"{backup_info['app']}_{backup_info['timestamp']}"
+        suffix = backup_id[len(base_id) + 1:] if backup_id.startswith(base_id + "_") else ""
+        # Compare the suffix numerically, so _10 sorts after _2
+        return backup_info["timestamp"], int(suffix) if suffix.isdigit() else 1
+    
+    def _is_older_than(self, backup_info: Dict, cutoff_epoch: int) -> bool:
+        """Check a backup's age; backups with an unreadable timestamp are never too old"""
+        try:
+            ts_epoch = backup_info.get("ts_epoch") or int(
+                datetime.datetime.strptime(backup_info["timestamp"], "%Y%m%d_%H%M%S").timestamp())
+        except (KeyError, ValueError):
+            return False
+        return ts_epoch < cutoff_epoch
+    
     def _remove_backup(self, backup_id: str) -> bool:
         """Remove a specific backup"""
         try:
@@ -175,53 +392,136 @@ class ConfigBackupManager:
             if backup_path.exists():
                 backup_path.unlink()
             
-            del self.metadata["backups"][backup_id]
+            self._record_event({"op": "remove_backup", "id": backup_id})
             return True
             
         except Exception as e:
             logger.error(f"Error removing backup {backup_id}: {e}")
             return False
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file"""
+    def _fast_copy(self, src: Path, dst: Path):
+        """Copy file data in-kernel (copy_file_range) plus mode and times, like shutil.copy2"""
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_stat = os.fstat(fsrc.fileno())
+            
+            try:
+                remaining = src_stat.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            except (AttributeError, OSError):
+                # No copy_file_range (non-Linux) or unsupported here (e.g. cross-device)
+                pass
+            
+            # Copies whatever is left from the current offsets (normally nothing)
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+        
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    
+    def _copy_and_hash(self, src: Path, dst: Path) -> Tuple[str, str, int]:
+        """Copy a file while computing its SHA256, fast checksum and size in the same pass"""
+        sha256_hash = hashlib.sha256()
+        checksum = xxhash.xxh3_64() if xxhash is not None else None
+        crc = 0
+        size = 0
+        
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_stat = os.fstat(fsrc.fileno())
+            
+            while chunk := fsrc.read(1 << 20):
+                fdst.write(chunk)
+                sha256_hash.update(chunk)
+                if checksum is not None:
+                    checksum.update(chunk)
+                else:
+                    crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+        
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+        
+        content_crc = f"xxh3_64:{checksum.hexdigest()}" if checksum is not None else f"crc32:{crc:08x}"
+        return sha256_hash.hexdigest(), content_crc, size
+    
+    def _calculate_file_hash(self, file_path: Path, algo: str = "sha256") -> str:
+        """Calculate a cryptographic hash (SHA256 by default) of a file"""
         try:
-            sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                # file_digest (Python 3.11+) runs the read/update loop in C
+                if hasattr(hashlib, "file_digest"):
+                    return hashlib.file_digest(f, algo).hexdigest()
+                
+                file_hash = hashlib.new(algo)
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    file_hash.update(chunk)
+            return file_hash.hexdigest()
         except Exception as e:
             logger.error(f"Error calculating hash for {file_path}: {e}")
             return ""
     
+    def _calculate_file_crc(self, file_path: Path) -> str:
+        """Calculate a fast non-cryptographic checksum, prefixed with its algorithm"""
+        try:
+            with open(file_path, "rb") as f:
+                if xxhash is not None:
+                    checksum = xxhash.xxh3_64()
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        checksum.update(chunk)
+                    return f"xxh3_64:{checksum.hexdigest()}"
+                
+                crc = 0
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    crc = zlib.crc32(chunk, crc)
+                return f"crc32:{crc:08x}"
+        except Exception as e:
+            logger.error(f"Error calculating checksum for {file_path}: {e}")
+            return ""
+    
     def create_theme_snapshot(self, theme_name: str, color_palette: Dict, applied_configs: Dict) -> str:
         """Create a snapshot of the current theme configuration"""
         try:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             snapshot_id = f"theme_{theme_name}_{timestamp}"
             
-            # Create backups of all modified files
-            backup_ids = []
-            for app_name, config_files in applied_configs.items():
-                for config_file in config_files:
-                    backup_id = self.create_backup(config_file, app_name, f"theme_{theme_name}")
-                    if backup_id:
-                        backup_ids.append(backup_id)
+            # Create backups of all modified files; each copy is independent I/O
+            jobs = [(app_name, config_file) 
+                    for app_name, config_files in applied_configs.items()
+                    for config_file in config_files]
+            reason = f"theme_{theme_name}"
+            
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs) or 1)) as executor:
+                results = executor.map(lambda job: self.create_backup(job[1], job[0], reason), jobs)
+                backup_ids = [backup_id for backup_id in results if backup_id]
             
-            # Store theme information
-            theme_info = {
+            # Store theme information in its own file; the metadata index entry
+            # carries everything list_theme_snapshots shows
+            theme_entry = {
                 "snapshot_id": snapshot_id,
-                "theme_name": theme_name,
                 "timestamp": timestamp,
+                "theme_name": theme_name,
+                "readable_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            theme_info = theme_entry | {
                 "color_palette": color_palette,
                 "applied_configs": applied_configs,
-                "backup_ids": backup_ids,
-                "readable_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "backup_ids": backup_ids
             }
             
-            self.metadata["theme_history"].append(theme_info)
-            self.metadata["current_theme"] = theme_info
-            self._save_metadata()
+            # Write aside and rename, like the metadata file
+            snapshot_path = self._snapshot_path(snapshot_id)
+            tmp_file = snapshot_path.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(theme_info))
+            os.replace(tmp_file, snapshot_path)
+            self._cache_snapshot(theme_info)
+            
+            self._record_event({"op": "snapshot", "theme": theme_entry})
             
             logger.info(f"Created theme snapshot: {snapshot_id}")
             return snapshot_id
@@ -233,25 +533,28 @@ class ConfigBackupManager:
     def restore_theme_snapshot(self, snapshot_id: str) -> bool:
         """Restore a complete theme snapshot"""
         try:
-            theme_info = None
+            theme_entry = None
             for theme in self.metadata["theme_history"]:
                 if theme["snapshot_id"] == snapshot_id:
-                    theme_info = theme
+                    theme_entry = theme
                     break
             
+            theme_info = self._load_snapshot(theme_entry) if theme_entry else None
             if not theme_info:
                 logger.error(f"Theme snapshot not found: {snapshot_id}")
                 return False
             
-            # Restore all backup files
-            success_count = 0
-            for backup_id in theme_info["backup_ids"]:
-                if self.restore_backup(backup_id, create_current_backup=False):
-                    success_count += 1
+            # Restore all backup files; each restore is independent I/O
+            backup_ids = theme_info["backup_ids"]
+            with ThreadPoolExecutor(max_workers=min(8, len(backup_ids) or 1)) as executor:
+                results = executor.map(
+                    lambda backup_id: self.restore_backup(backup_id, create_current_backup=False), 
+                    backup_ids
+                )
+                success_count = sum(results)
             
             if success_count == len(theme_info["backup_ids"]):
-                self.metadata["current_theme"] = theme_info
-                self._save_metadata()
+                self._record_event({"op": "set_current_theme", "theme": theme_entry})
                 logger.info(f"Successfully restored theme snapshot: {snapshot_id}")
                 return True
             else:
@@ -263,13 +566,47 @@ class ConfigBackupManager:
             return False
     
     def list_theme_snapshots(self) -> List[Dict]:
-        """List all theme snapshots"""
-        return sorted(self.metadata.get("theme_history", []), 
-                     key=lambda x: x["timestamp"], reverse=True)
+        """List all theme snapshots (index entries; use _load_snapshot for the full record)"""
+        entries = sorted(self.metadata.get("theme_history", []), 
+                         key=lambda x: x["timestamp"], reverse=True)
+        return [dict(entry) for entry in entries]
     
     def get_current_theme(self) -> Optional[Dict]:
         """Get information about the current theme"""
-        return self.metadata.get("current_theme")
+        current = self.metadata.get("current_theme")
+        return self._load_snapshot(current) if current else None
+    
+    def _snapshot_path(self, snapshot_id: str) -> Path:
+        """Path of the file holding a snapshot's full record"""
+        return self.snapshots_dir / f"{snapshot_id.replace(os.sep, '_')}.json"
+    
+    def _cache_snapshot(self, theme_info: Dict):
+        """Remember a full snapshot record, evicting the least recently used"""
+        self._snapshot_cache[theme_info["snapshot_id"]] = theme_info
+        self._snapshot_cache.move_to_end(theme_info["snapshot_id"])
+        if len(self._snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+            self._snapshot_cache.popitem(last=False)
+    
+    def _load_snapshot(self, entry: Dict) -> Optional[Dict]:
+        """Resolve a theme_history index entry to the full snapshot record"""
+        # Metadata written by older versions stored the full record inline
+        if "backup_ids" in entry:
+            return entry
+        
+        snapshot_id = entry["snapshot_id"]
+        if snapshot_id in self._snapshot_cache:
+            self._snapshot_cache.move_to_end(snapshot_id)
+            return self._snapshot_cache[snapshot_id]
+        
+        try:
+            with open(self._snapshot_path(snapshot_id), 'rb') as f:
+                theme_info = _loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading theme snapshot {snapshot_id}: {e}")
+            return None
+        
+        self._cache_snapshot(theme_info)
+        return theme_info
     
     def verify_backup_integrity(self, backup_id: str) -> bool:
         """Verify the integrity of a backup file"""
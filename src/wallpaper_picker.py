@@ -4,14 +4,133 @@ Wallpaper Picker for MatYouAI
 Integrates with rofi to provide wallpaper selection and theme triggering
 """
 
+import os
+import socket
+import sqlite3
 import subprocess
 import logging
-from typing import List, Optional, Dict
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Dict, Tuple
 from pathlib import Path
 import json
 
 logger = logging.getLogger(__name__)
 
+# Directories that never hold wallpapers but can be huge; not descended into
+_PRUNED_DIRS = frozenset({"node_modules", "__pycache__", "Trash"})
+
+@dataclass(slots=True)
+class WallpaperTable:
+    """Found wallpapers stored column-wise (one list per field instead of a dict per file)"""
+    paths: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    dirs: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    mtimes: array = field(default_factory=lambda: array('q'))
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def append(self, path: str, name: str, dir_path: str, size: int, mtime_ns: int):
+        """Add one wallpaper row"""
+        self.paths.append(path)
+        self.names.append(name)
+        self.dirs.append(dir_path)
+        self.sizes.append(size)
+        self.mtimes.append(mtime_ns)
+    
+    def extend(self, other: "WallpaperTable"):
+        """Append all rows of another table"""
+        self.paths.extend(other.paths)
+        self.names.extend(other.names)
+        self.dirs.extend(other.dirs)
+        self.sizes.extend(other.sizes)
+        self.mtimes.extend(other.mtimes)
+    
+    def reordered(self, order: List[int]) -> "WallpaperTable":
+        """Return a copy with rows in the given order"""
+        return WallpaperTable(
+            [self.paths[i] for i in order],
+            [self.names[i] for i in order],
+            [self.dirs[i] for i in order],
+            array('q', (self.sizes[i] for i in order)),
+            array('q', (self.mtimes[i] for i in order))
+        )
+    
+    def row(self, index: int) -> Dict[str, str]:
+        """Return one wallpaper in the old dict form"""
+        return {
+            "path": self.paths[index],
+            "name": self.names[index],
+            "dir": self.dirs[index],
+            "size": self.sizes[index]
+        }
+
+class _WallpaperIndex:
+    """Persistent SQLite copy of the last wallpaper scan, so a fresh start can skip the walk"""
+    
+    SCHEMA_VERSION = 2
+    
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        
+        # It's only a cache: on a schema change just start over
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with self.conn:
+                self.conn.execute("DROP TABLE IF EXISTS wallpapers")
+                self.conn.execute("DROP TABLE IF EXISTS dirs")
+                self.conn.execute("DROP TABLE IF EXISTS meta")
+                self.conn.execute("CREATE TABLE wallpapers (path TEXT PRIMARY KEY, name TEXT, dir TEXT, size INTEGER, mtime_ns INTEGER)")
+                self.conn.execute("CREATE INDEX wallpapers_dir ON wallpapers (dir)")
+                self.conn.execute("CREATE TABLE dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER)")
+                self.conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+    
+    def load_signature(self, roots: List[str]) -> Optional[Dict[str, Optional[int]]]:
+        """Get the stored directory signature, if it was recorded for the same roots"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'roots'").fetchone()
+        if row is None or json.loads(row[0]) != roots:
+            return None
+        
+        signature = dict(self.conn.execute("SELECT path, mtime_ns FROM dirs"))
+        return signature or None
+    
+    def load_table(self) -> WallpaperTable:
+        """Load the stored wallpapers (unsorted)"""
+        table = WallpaperTable()
+        for row in self.conn.execute("SELECT path, name, dir, size, mtime_ns FROM wallpapers"):
+            table.append(*row)
+        return table
+    
+    def store(self, table: WallpaperTable, signature: Dict[str, Optional[int]], roots: List[str]):
+        """Update the stored scan in a single transaction, writing only rows that changed"""
+        stored = dict(self.conn.execute("SELECT path, mtime_ns FROM wallpapers"))
+        
+        # Unchanged (path, mtime) rows are kept as they are
+        changed = [row for row in zip(table.paths, table.names, table.dirs, table.sizes, table.mtimes)
+                   if stored.get(row[0]) != row[4]]
+        removed = stored.keys() - set(table.paths)
+        
+        with self.conn:
+            self.conn.executemany("DELETE FROM wallpapers WHERE path = ?", ((path,) for path in removed))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO wallpapers (path, name, dir, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                changed
+            )
+            self.conn.execute("DELETE FROM dirs")
+            self.conn.executemany("INSERT INTO dirs (path, mtime_ns) VALUES (?, ?)", signature.items())
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('roots', ?)", (json.dumps(roots),))
+    
+    def invalidate(self):
+        """Make the stored scan unusable so the next lookup rescans"""
+        with self.conn:
+            self.conn.execute("DELETE FROM dirs")
+
 class WallpaperPicker:
     """Handles wallpaper selection via rofi and swww integration"""
     
@@ -23,55 +142,182 @@ class WallpaperPicker:
             "/usr/share/pixmaps",
             "/usr/share/backgrounds"
         ]
-        self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp'}
+        self.supported_formats = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp'})
+        
+        # Last scan result plus the mtime of every directory it walked
+        self._cache: Optional[Tuple[WallpaperTable, Dict[str, Optional[int]]]] = None
+        
+        # The same data persisted across runs, opened on first use
+        self.index_path = Path.home() / ".cache" / "matyouai" / "wallpapers.db"
+        self._index: Optional[_WallpaperIndex] = None
+        self._index_failed = False
+        
+        # swww --version only needs to succeed once per process
+        self._swww_version_checked = False
+        
+    def find_wallpapers(self) -> WallpaperTable:
+        """Find all wallpapers in configured directories (cached until a directory changes)"""
+        if self._cache is not None and self._signature_matches(self._cache[1]):
+            return self._cache[0]
         
-    def find_wallpapers(self) -> List[Dict[str, str]]:
-        """Find all wallpapers in configured directories"""
-        wallpapers = []
+        home = str(Path.home())
+        roots = [dir_path.replace("~", home) for dir_path in self.wallpaper_dirs]
+        index = self._get_index()
         
-        for dir_path in self.wallpaper_dirs:
-            expanded_path = Path(dir_path.replace("~", str(Path.home())))
+        # On a fresh start, reuse the previous run's scan if no directory changed since
+        if self._cache is None and index is not None:
+            try:
+                stored_signature = index.load_signature(roots)
+                if stored_signature is not None and self._signature_matches(stored_signature):
+                    wallpapers = self._sort_by_name(index.load_table())
+                    self._cache = (wallpapers, stored_signature)
+                    return wallpapers
+            except sqlite3.Error as e:
+                logger.warning(f"Wallpaper index unreadable, rescanning: {e}")
+        
+        # Missing roots are remembered too, so creating one later invalidates the cache
+        signature: Dict[str, Optional[int]] = {root: None for root in roots}
+        
+        wallpapers = WallpaperTable()
+        if roots:
+            # Roots are often on different disks/mounts, so walk them concurrently
+            # (map keeps the configured order, so ties in the sort stay stable).
+            # Missing roots are detected by the walk itself, no separate exists() probe
+            with ThreadPoolExecutor(max_workers=min(8, len(roots))) as executor:
+                for found, dir_mtimes in executor.map(self._scan_directory, roots):
+                    wallpapers.extend(found)
+                    signature.update(dir_mtimes)
+        
+        # Roots may nest (~/Pictures/wallpapers inside ~/Pictures); the index
+        # keys rows by path, so drop repeats here to match what it stores
+        wallpapers = self._sort_by_name(self._unique_paths(wallpapers))
+        self._cache = (wallpapers, signature)
+        
+        if index is not None:
+            try:
+                index.store(wallpapers, signature, roots)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update wallpaper index: {e}")
+        
+        return wallpapers
+    
+    def _sort_by_name(self, wallpapers: WallpaperTable) -> WallpaperTable:
+        """Sort wallpapers by file name, ignoring case (like rofi's -i matching)"""
+        # Decorate-sort-undecorate: keys are casefolded once, ties keep scan order
+        keyed = [(name.casefold(), i) for i, name in enumerate(wallpapers.names)]
+        keyed.sort()
+        return wallpapers.reordered([i for _, i in keyed])
+    
+    def _unique_paths(self, wallpapers: WallpaperTable) -> WallpaperTable:
+        """Keep only the first row for each path"""
+        seen = set()
+        order = []
+        for i, path in enumerate(wallpapers.paths):
+            if path not in seen:
+                seen.add(path)
+                order.append(i)
+        
+        if len(order) == len(wallpapers):
+            return wallpapers
+        return wallpapers.reordered(order)
+    
+    def _get_index(self) -> Optional[_WallpaperIndex]:
+        """Open the persistent wallpaper index (None if it can't be used)"""
+        if self._index is None and not self._index_failed:
+            try:
+                self._index = _WallpaperIndex(self.index_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Wallpaper index disabled: {e}")
+                self._index_failed = True
+        return self._index
+    
+    def invalidate_cache(self):
+        """Forget the cached wallpaper list so the next lookup rescans"""
+        self._cache = None
+        
+        index = self._get_index()
+        if index is not None:
+            try:
+                index.invalidate()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to invalidate wallpaper index: {e}")
+    
+    def _signature_matches(self, signature: Dict[str, Optional[int]]) -> bool:
+        """Check that no scanned directory was modified, created or removed since the scan"""
+        for dir_path, mtime_ns in signature.items():
+            try:
+                current = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                current = None
             
-            if not expanded_path.exists():
-                continue
-                
+            if current != mtime_ns:
+                return False
+        
+        return True
+    
+    def _scan_directory(self, root: str) -> Tuple[WallpaperTable, Dict[str, Optional[int]]]:
+        """Walk a directory tree with os.scandir and collect image files and directory mtimes"""
+        wallpapers = WallpaperTable()
+        dir_mtimes = {}
+        stack = [root]
+        
+        while stack:
+            current = stack.pop()
             try:
-                for file_path in expanded_path.rglob("*"):
-                    if (file_path.is_file() and 
-                        file_path.suffix.lower() in self.supported_formats):
+                # Stat before listing: a change made while listing still bumps the mtime
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+                
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        
+                        # Like rglob, don't follow symlinked directories; also skip .cache, .git,
+                        # node_modules, ...
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith('.') and name not in _PRUNED_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        
+                        # Cheap name check first, stat only for actual images
+                        if not self._ext_matches(name):
+                            continue
                         
-                        wallpapers.append({
-                            "path": str(file_path),
-                            "name": file_path.name,
-                            "dir": str(file_path.parent),
-                            "size": file_path.stat().st_size
-                        })
+                        try:
+                            if not entry.is_file():
+                                continue
+                            entry_stat = entry.stat()
+                        except OSError:
+                            continue
+                        
+                        wallpapers.append(entry.path, name, current, entry_stat.st_size, entry_stat.st_mtime_ns)
+            except (FileNotFoundError, NotADirectoryError) as e:
+                # A configured root that doesn't exist is normal (e.g. no ~/Pictures/wallpapers)
+                if current != root:
+                    logger.error(f"Error scanning {current}: {e}")
             except PermissionError:
-                logger.warning(f"Permission denied accessing {expanded_path}")
-            except Exception as e:
-                logger.error(f"Error scanning {expanded_path}: {e}")
+                logger.warning(f"Permission denied accessing {current}")
+            except OSError as e:
+                logger.error(f"Error scanning {current}: {e}")
         
-        # Sort by name
-        wallpapers.sort(key=lambda x: x["name"])
-        return wallpapers
+        return wallpapers, dir_mtimes
+    
+    def _ext_matches(self, name: str) -> bool:
+        """Check a file name against supported_formats, lower-casing only when needed"""
+        dot = name.rfind('.')
+        # dot == 0 is a hidden file like ".png", which has no extension
+        if dot <= 0:
+            return False
+        
+        ext = name[dot:]
+        return ext in self.supported_formats or ext.lower() in self.supported_formats
     
-    def show_rofi_picker(self, wallpapers: List[Dict[str, str]]) -> Optional[str]:
+    def show_rofi_picker(self, wallpapers: WallpaperTable) -> Optional[str]:
         """Show rofi picker for wallpaper selection"""
         try:
-            # Prepare rofi options
-            rofi_options = []
-            for wp in wallpapers:
-                # Show name and directory for context
-                display_name = f"{wp['name']} ({wp['dir']})"
-                rofi_options.append(display_name)
-            
-            if not rofi_options:
+            if not wallpapers:
                 logger.error("No wallpapers found")
                 return None
             
-            # Create rofi input
-            rofi_input = "\n".join(rofi_options)
-            
             # Run rofi
             cmd = [
                 "rofi", "-dmenu", 
@@ -81,18 +327,16 @@ class WallpaperPicker:
                 "-theme-str", "window { width: 60%; } listview { lines: 10; }"
             ]
             
-            result = subprocess.run(
-                cmd, 
-                input=rofi_input, 
-                text=True, 
-                capture_output=True
+            # Show name and directory for context
+            stdout = self._run_rofi_dmenu(
+                cmd, (f"{name} ({dir_path})" for name, dir_path in zip(wallpapers.names, wallpapers.dirs))
             )
             
-            if result.returncode == 0:
+            if stdout is not None:
                 try:
-                    selected_index = int(result.stdout.strip())
+                    selected_index = int(stdout)
                     if 0 <= selected_index < len(wallpapers):
-                        selected_wallpaper = wallpapers[selected_index]["path"]
+                        selected_wallpaper = wallpapers.paths[selected_index]
                         logger.info(f"Selected wallpaper: {selected_wallpaper}")
                         return selected_wallpaper
                 except (ValueError, IndexError):
@@ -109,30 +353,61 @@ class WallpaperPicker:
             logger.error(f"Error running rofi picker: {e}")
             return None
     
+    def _run_rofi_dmenu(self, cmd: List[str], options: Iterable[str]) -> Optional[str]:
+        """Run a rofi -dmenu prompt, streaming options to it; returns the selection or None if cancelled"""
+        # Options are written one line at a time instead of as one big input string
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        
+        try:
+            for option in options:
+                proc.stdin.write(option + "\n")
+            proc.stdin.close()
+        except BrokenPipeError:
+            # rofi exited before reading everything (e.g. it failed to start a window)
+            pass
+        
+        stdout = proc.stdout.read()
+        proc.stdout.close()
+        
+        if proc.wait() != 0:
+            return None
+        return stdout.strip()
+    
     def set_wallpaper_with_swww(self, wallpaper_path: str) -> bool:
         """Set wallpaper using swww with enhanced error detection"""
         try:
-            # First, check if swww is installed and get version info
-            version_cmd = ["swww", "--version"]
-            try:
-                version_result = subprocess.run(version_cmd, capture_output=True, text=True, timeout=5)
-                if version_result.returncode != 0:
-                    logger.error("swww is installed but --version failed. This may indicate an old or corrupted installation.")
-                    logger.error("Please reinstall swww: yay -S swww")
+            # First, check if swww is installed and get version info (once)
+            if not self._swww_version_checked:
+                version_cmd = ["swww", "--version"]
+                try:
+                    version_result = subprocess.run(version_cmd, capture_output=True, text=True, timeout=5)
+                    if version_result.returncode != 0:
+                        logger.error("swww is installed but --version failed. This may indicate an old or corrupted installation.")
+                        logger.error("Please reinstall swww: yay -S swww")
+                        return False
+                except subprocess.TimeoutExpired:
+                    logger.error("swww --version command timed out. This may indicate system issues.")
                     return False
-            except subprocess.TimeoutExpired:
-                logger.error("swww --version command timed out. This may indicate system issues.")
-                return False
-            except FileNotFoundError:
-                logger.error("❌ swww not found!")
-                logger.error("Install it with: yay -S swww")
-                return False
+                except FileNotFoundError:
+                    logger.error("❌ swww not found!")
+                    logger.error("Install it with: yay -S swww")
+                    return False
+                
+                self._swww_version_checked = True
             
-            # Check if swww daemon is running
-            check_cmd = ["pgrep", "swww-daemon"]
-            check_result = subprocess.run(check_cmd, capture_output=True)
+            # Check if swww daemon is running: its socket answers in well under a
+            # millisecond; look at /proc only if no socket was found at all
+            daemon_alive = self._swww_daemon_alive()
+            if daemon_alive is None:
+                daemon_alive = self._is_process_running("swww-daemon")
             
-            if check_result.returncode != 0:
+            if not daemon_alive:
                 logger.info("swww-daemon not running, starting it...")
                 
                 # Try to start swww-daemon (current method)
@@ -214,12 +489,67 @@ class WallpaperPicker:
             logger.error("If you were using 'swww init', that's deprecated - use 'swww-daemon' instead")
             return False
     
+    def _swww_daemon_alive(self) -> Optional[bool]:
+        """Probe swww-daemon's socket; None if no socket file could be found"""
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if not runtime_dir:
+            return None
+        
+        # The socket name changed between swww releases (swww.socket,
+        # swww-$WAYLAND_DISPLAY.socket, $WAYLAND_DISPLAY-swww-daemon.*.sock)
+        try:
+            with os.scandir(runtime_dir) as entries:
+                sockets = [entry.path for entry in entries
+                           if "swww" in entry.name and entry.name.endswith((".sock", ".socket"))]
+        except OSError:
+            return None
+        
+        if not sockets:
+            return None
+        
+        for sock_path in sockets:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(0.1)
+            try:
+                sock.connect(sock_path)
+                return True
+            except OSError:
+                # Stale socket left behind by a crashed daemon
+                continue
+            finally:
+                sock.close()
+        
+        return False
+    
+    def _is_process_running(self, name: str) -> bool:
+        """Check for a running process by name by reading /proc directly (no pgrep fork)"""
+        if not os.path.isdir("/proc"):
+            return subprocess.run(["pgrep", name], capture_output=True).returncode == 0
+        
+        target = name.encode()
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                
+                try:
+                    with open(f"/proc/{entry.name}/comm", "rb") as f:
+                        if f.read().rstrip(b"\n") == target:
+                            return True
+                except OSError:
+                    # Process exited while scanning, or not ours to read
+                    continue
+        
+        return False
+    
     def launch_picker_and_apply_theme(self, theme_applicator=None, 
-                                    preview_mode: bool = False) -> Optional[Dict]:
-        """Launch wallpaper picker and apply theme in one go"""
+                                    preview_mode: bool = False,
+                                    wallpapers: Optional[WallpaperTable] = None) -> Optional[Dict]:
+        """Launch wallpaper picker and apply theme in one go (reuses wallpapers if already scanned)"""
         try:
             # Find wallpapers
-            wallpapers = self.find_wallpapers()
+            if wallpapers is None:
+                wallpapers = self.find_wallpapers()
             if not wallpapers:
                 logger.error("No wallpapers found in configured directories")
                 return None
@@ -271,19 +601,13 @@ class WallpaperPicker:
                 logger.info("No existing themes found")
                 return None
             
-            # Prepare rofi options
-            rofi_options = []
+            # Prepare rofi options: special options first (plain ASCII markers,
+            # emoji clusters go through rofi's slow shaping path), then themes
+            rofi_options = ["+ Pick New Wallpaper", "? Preview Mode"]
             for theme in themes:
                 theme_name = theme.get("theme_name", "Unknown")
                 readable_time = theme.get("readable_time", theme.get("timestamp", ""))
-                display_name = f"{theme_name} ({readable_time})"
-                rofi_options.append(display_name)
-            
-            # Add special options
-            rofi_options.insert(0, "🎨 Pick New Wallpaper")
-            rofi_options.insert(1, "👁️ Preview Mode")
-            
-            rofi_input = "\n".join(rofi_options)
+                rofi_options.append(f"{theme_name} ({readable_time})")
             
             # Run rofi
             cmd = [
@@ -294,16 +618,11 @@ class WallpaperPicker:
                 "-theme-str", "window { width: 50%; } listview { lines: 8; }"
             ]
             
-            result = subprocess.run(
-                cmd,
-                input=rofi_input,
-                text=True,
-                capture_output=True
-            )
+            selection = self._run_rofi_dmenu(cmd, rofi_options)
             
-            if result.returncode == 0:
+            if selection is not None:
                 try:
-                    selected_index = int(result.stdout.strip())
+                    selected_index = int(selection)
                     
                     if selected_index == 0:
                         # Pick new wallpaper
@@ -333,17 +652,22 @@ class WallpaperPicker:
             if not theme_applicator:
                 return False
             
+            # Extract the palette once; it is reused if the theme is applied
+            palette = theme_applicator.color_extractor.extract_palette(Path(wallpaper_path))
+            if not palette:
+                self._show_rofi_message("Preview Failed", "Could not extract colors from wallpaper")
+                return False
+            
             # Generate preview
-            preview_result = theme_applicator.preview_theme(wallpaper_path)
+            preview_result = theme_applicator.preview_theme(palette)
             
             if not preview_result.get("success", False):
                 self._show_rofi_message("Preview Failed", 
-                                       f"Could not generate theme preview: {preview_result.get('errors', ['Unknown error'])}")
+                                       f"Could not generate theme preview: {preview_result.get('error', 'Unknown error')}")
                 return False
             
             # Show preview results
-            palette = preview_result.get("color_palette", {})
-            applied_apps = preview_result.get("applied_apps", [])
+            applied_apps = [app["app"] for app in preview_result.get("applied_apps", [])]
             
             preview_info = f"""Theme Preview
 Wallpaper: {Path(wallpaper_path).name}
@@ -360,26 +684,21 @@ Apply this theme?"""
                 "-theme-str", "window { width: 40%; }"
             ]
             
-            confirm_options = "Yes\nNo"
-            result = subprocess.run(
-                cmd,
-                input=confirm_options,
-                text=True,
-                capture_output=True
-            )
+            selection = self._run_rofi_dmenu(cmd, ["Yes", "No"])
             
-            if result.returncode == 0 and result.stdout.strip().lower() == "yes":
+            if selection is not None and selection.lower() == "yes":
                 # Apply the theme for real
                 apply_result = theme_applicator.apply_theme_from_wallpaper(
                     wallpaper_path,
-                    theme_name=f"applied_{Path(wallpaper_path).stem}"
+                    theme_name=f"applied_{Path(wallpaper_path).stem}",
+                    precomputed_palette=palette
                 )
                 
                 if apply_result.get("success", False):
                     self._show_rofi_message("Success", "Theme applied successfully!")
                     return True
                 else:
-                    self._show_rofi_message("Error", f"Failed to apply theme: {apply_result.get('errors', ['Unknown error'])}")
+                    self._show_rofi_message("Error", f"Failed to apply theme: {apply_result.get('error', 'Unknown error')}")
             
             return False
             